@@ -4,59 +4,108 @@ import csv
 import datetime as dt
 import json
 import re
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
+from urllib.parse import quote, urlsplit
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util import make_headers
+from urllib3.util.retry import Retry
 
 try:
     from packaging.version import parse as vparse
-except Exception:  # pragma: no cover - best-effort import
-    vparse = None
+except Exception as exc:  # pragma: no cover - best-effort import
+    raise SystemExit(
+        "packaging is required to compare versions. "
+        "Install it with: pip install packaging"
+    ) from exc
 
 try:
-    from openpyxl import Workbook
+    import orjson
+except Exception:  # pragma: no cover - optional speedup
+    orjson = None
+
+try:
+    from openpyxl import LXML as OPENPYXL_LXML, Workbook
+    from openpyxl.cell import Cell, WriteOnlyCell
     from openpyxl.styles import Alignment, Font, PatternFill
+    from openpyxl.utils import get_column_letter
+    from openpyxl.worksheet.cell_range import CellRange
 except Exception as exc:  # pragma: no cover - best-effort import
     raise SystemExit(
         "openpyxl is required to write the Excel file. "
         "Install it with: pip install openpyxl"
     ) from exc
 
-LINE_RE = re.compile(r"^\s*([A-Za-z0-9_.-]+)\s*==\s*([^\s;]+)")
+LINE_RE = re.compile(r"(?m)^[ \t]*([A-Za-z0-9_.-]+)[ \t]*==[ \t]*([^\s;#]+)")
 NPM_VERSION_RE = re.compile(r"(\d+\.\d+\.\d+(?:[-+][0-9A-Za-z.-]+)?)")
 PIPFILE_PACKAGE_RE = re.compile(r'^\s*([A-Za-z0-9_.-]+)\s*=\s*"(.*?)"\s*$')
-PYPI_URL = "https://pypi.org/pypi/{name}/json"
-NPM_URL = "https://registry.npmjs.org/{name}"
+PYPI_BASE_URL = "https://pypi.org/simple"
+PYPI_SIMPLE_ACCEPT = "application/vnd.pypi.simple.v1+json"
+NPM_BASE_URL = "https://registry.npmjs.org"
 BA_LIST_PATH = "ba_list_21_04_2026.csv"
-BA_LINK_TEMPLATE = (
-    "https://pls.appoci.oraclecorp.com/PLS/faces/ThirdPartyHome?wid={ba_id}"
+BA_LINK_BASE = "https://pls.appoci.oraclecorp.com/PLS/faces/ThirdPartyHome?wid="
+EXCLUDED_PACKAGES = frozenset(
+    name.casefold()
+    for name in (
+        "colorlog",
+        "django-extensions",
+        "redis",
+        "setuptools",
+        "wheel",
+    )
 )
-EXCLUDED_PACKAGES = {
-    "colorlog",
-    "django-extensions",
-    "redis",
-    "setuptools",
-    "wheel",
-}
+# Packages whose latest version is looked up within the pinned release series.
+MAJOR_PIN_POLICY = {"django": "major"}
+PIN_POLICY_DEPTH = {"major": 1, "minor": 2}
+# Columns after package/current_version for rows whose metadata lookup failed.
+EMPTY_ROW_TRAIL = (None,) * 11
+FETCH_WORKERS = 20
+MAX_REQUESTS_PER_SECOND = 20.0
+CACHE_DIR = Path.home() / ".cache" / "pip_release_report"
+CACHE_TTL_SECONDS = 6 * 60 * 60
+
+
+def pypi_url(name: str) -> str:
+    return f"{PYPI_BASE_URL}/{name}/"
+
+
+def npm_url(name: str) -> str:
+    return f"{NPM_BASE_URL}/{name}"
+
+
+def ba_link(ba_id: str) -> str:
+    return f"{BA_LINK_BASE}{ba_id}"
+
+
+def load_json(raw: bytes | str):
+    if orjson:
+        return orjson.loads(raw)
+    try:
+        return json.loads(raw)
+    except UnicodeDecodeError as exc:
+        # Match orjson, which reports invalid UTF-8 as a JSONDecodeError
+        raise json.JSONDecodeError(str(exc), "", 0) from exc
 
 
 def parse_pip_file(path: Path) -> list[tuple[str, str]]:
-    items: list[tuple[str, str]] = []
-    for raw in path.read_text(encoding="utf-8").splitlines():
-        line = raw.strip()
-        if not line or line.startswith("#"):
-            continue
-        match = LINE_RE.match(line)
-        if not match:
-            continue
-        name, version = match.group(1), match.group(2)
-        items.append((name, version))
-    return items
+    return [
+        (name, version)
+        for name, version in LINE_RE.findall(path.read_text(encoding="utf-8"))
+        if name.casefold() not in EXCLUDED_PACKAGES
+    ]
 
 
 def parse_package_json(path: Path) -> list[tuple[str, str]]:
     try:
-        data = json.loads(path.read_text(encoding="utf-8"))
+        data = load_json(path.read_bytes())
     except json.JSONDecodeError:
         return []
     items: list[tuple[str, str]] = []
@@ -66,7 +115,7 @@ def parse_package_json(path: Path) -> list[tuple[str, str]]:
     for name, spec in deps.items():
         if not isinstance(spec, str):
             continue
-        if name.startswith("@angular/"):
+        if name.startswith("@angular/") or name.casefold() in EXCLUDED_PACKAGES:
             continue
         items.append((name, spec))
     return items
@@ -79,7 +128,7 @@ def parse_pipfile(path: Path) -> list[tuple[str, str]]:
     lock_path = path.with_name("Pipfile.lock")
     if lock_path.exists():
         try:
-            lock_data = json.loads(lock_path.read_text(encoding="utf-8"))
+            lock_data = load_json(lock_path.read_bytes())
             default_section = lock_data.get("default", {})
             if isinstance(default_section, dict):
                 for name, meta in default_section.items():
@@ -103,7 +152,7 @@ def parse_pipfile(path: Path) -> list[tuple[str, str]]:
         if not match:
             continue
         name, spec = match.group(1), match.group(2)
-        if not spec:
+        if not spec or name.casefold() in EXCLUDED_PACKAGES:
             continue
         spec = spec.lstrip("=")
         if name in lock_versions:
@@ -113,27 +162,62 @@ def parse_pipfile(path: Path) -> list[tuple[str, str]]:
     return items
 
 
+@lru_cache(maxsize=4096)
 def extract_npm_version(spec: str) -> str | None:
     match = NPM_VERSION_RE.search(spec)
     return match.group(1) if match else None
 
 
+def csv_field(row: list[str], idx: int | None) -> str:
+    if idx is None or idx >= len(row):
+        return ""
+    return row[idx].strip()
+
+
+def ba_sort_key(item: tuple[str, dict[str, dt.date | str | None]]):
+    ba_id, meta = item
+    end_date = meta.get("end_date")
+    if isinstance(end_date, dt.date):
+        key_date = end_date
+    elif isinstance(end_date, str):
+        try:
+            key_date = dt.date.fromisoformat(end_date)
+        except ValueError:
+            key_date = None
+    else:
+        key_date = None
+    status = (meta.get("status") or "").lower()
+    status_priority = 1 if status == "approved" else 0
+    return (key_date is None, key_date or dt.date.max, status_priority, ba_id)
+
+
 def load_ba_map(
     path: Path,
-) -> dict[tuple[str, str], dict[str, dict[str, dt.date | str | None]]]:
+) -> dict[tuple[str, str], list[tuple[str, dict[str, dt.date | str | None]]]]:
     if not path.exists():
         return {}
     mapping: dict[tuple[str, str], dict[str, dict[str, dt.date | str | None]]] = {}
     with path.open(encoding="utf-8", errors="replace") as handle:
-        reader = csv.DictReader(handle)
+        reader = csv.reader(handle)
+        header = next(reader, None)
+        if header is None:
+            return {}
+        positions = {column: idx for idx, column in enumerate(header)}
+        name_idx = positions.get("Licensed Item Name")
+        version_idx = positions.get("Licensed Item Version")
+        ba_id_idx = positions.get("Business Approval ID")
+        created_idx = positions.get("Created Date")
+        end_date_idx = positions.get("BA End Date")
+        end_action_idx = positions.get("BA End Date Action")
+        status_idx = positions.get("Status")
         for row in reader:
-            name = (row.get("Licensed Item Name") or "").strip()
-            version = (row.get("Licensed Item Version") or "").strip()
-            ba_id = (row.get("Business Approval ID") or "").strip()
-            created = (row.get("Created Date") or "").strip()
-            ba_end_date = (row.get("BA End Date") or "").strip()
-            ba_end_action = (row.get("BA End Date Action") or "").strip()
-            ba_status = (row.get("Status") or "").strip()
+            name = csv_field(row, name_idx)
+            version = csv_field(row, version_idx)
+            ba_id = csv_field(row, ba_id_idx)
+            created = csv_field(row, created_idx)
+            ba_end_date = csv_field(row, end_date_idx)
+            ba_end_action = csv_field(row, end_action_idx)
+            ba_status = csv_field(row, status_idx)
             if not name or not version or not ba_id:
                 continue
             created_value: dt.date | str | None = None
@@ -148,7 +232,7 @@ def load_ba_map(
                     end_date_value = dt.date.fromisoformat(ba_end_date)
                 except ValueError:
                     end_date_value = ba_end_date
-            key = (name.lower(), version)
+            key = (name.casefold(), version)
             mapping.setdefault(key, {})
             if ba_id not in mapping[key]:
                 mapping[key][ba_id] = {
@@ -157,127 +241,438 @@ def load_ba_map(
                     "end_action": ba_end_action or None,
                     "status": ba_status or None,
                 }
-    return mapping
+    return {
+        key: sorted(entries.items(), key=ba_sort_key, reverse=True)
+        for key, entries in mapping.items()
+    }
+
+
+def parse_iso_date(ts: str) -> dt.date | None:
+    try:
+        return dt.date.fromisoformat(ts[:10])
+    except ValueError:
+        pass
+    try:
+        return dt.datetime.fromisoformat(ts.replace("Z", "+00:00")).date()
+    except ValueError:
+        return None
 
 
-def get_release_date(releases: dict, version: str) -> dt.date | None:
-    files = releases.get(version) or []
-    dates = []
+def earliest_upload_date(files: list) -> dt.date | None:
+    # YYYY-MM-DD prefixes sort lexicographically.
+    earliest = None
     for entry in files:
         ts = entry.get("upload_time_iso_8601") or entry.get("upload_time")
-        if not ts:
-            continue
-        try:
-            dates.append(dt.datetime.fromisoformat(ts.replace("Z", "+00:00")))
-        except ValueError:
-            continue
-    if not dates:
-        return None
-    return min(dates).date()
+        if ts and (earliest is None or ts[:10] < earliest):
+            earliest = ts[:10]
+    return parse_iso_date(earliest) if earliest else None
 
 
-def is_stable_version(version: str) -> bool:
-    if not vparse:
-        return False
-    parsed = vparse(version)
+@lru_cache(maxsize=None)
+def parse_version(version: str):
+    return vparse(version)
+
+
+def is_stable_parsed(parsed) -> bool:
     # Exclude pre, post, dev, and local versions
     return not (parsed.is_prerelease or parsed.is_postrelease or parsed.is_devrelease or parsed.local)
 
 
-def get_latest_version(info: dict, releases: dict) -> str | None:
-    if not vparse:
-        return info.get("version")
-    versions = [v for v in releases.keys() if v and is_stable_version(v)]
-    if not versions:
-        return None
-    return str(max(versions, key=vparse))
+@lru_cache(maxsize=None)
+def is_stable_version(version: str) -> bool:
+    return is_stable_parsed(parse_version(version))
 
 
-def get_latest_version_same_major(
-    releases: dict, current_version: str
-) -> str | None:
-    if not vparse:
+def pin_prefix(current_version: str, policy: str | None) -> tuple | None:
+    depth = PIN_POLICY_DEPTH.get(policy)
+    if not depth:
         return None
     try:
-        current_major = vparse(current_version).release[0]
+        release = parse_version(current_version).release
     except Exception:
         return None
-    candidates = []
-    for version in releases.keys():
-        if not version or not is_stable_version(version):
-            continue
-        parsed = vparse(version)
-        if parsed.release and parsed.release[0] == current_major:
-            candidates.append(version)
-    if not candidates:
-        return None
-    return str(max(candidates, key=vparse))
+    return release[:depth] if len(release) >= depth else None
 
 
+def scan_releases(
+    releases: dict, current_version: str, policy: str | None = None
+) -> tuple[dt.date | None, str | None, dt.date | None]:
+    prefix = pin_prefix(current_version, policy)
+    latest = latest_pinned = None
+    for version, files in releases.items():
+        if not version or not is_stable_version(version):
+            continue
+        parsed = parse_version(version)
+        if latest is None or parsed > latest[0]:
+            latest = (parsed, version, files)
+        if (
+            prefix is not None
+            and parsed.release[: len(prefix)] == prefix
+            and (latest_pinned is None or parsed > latest_pinned[0])
+        ):
+            latest_pinned = (parsed, version, files)
+    current_date = earliest_upload_date(releases.get(current_version) or [])
+    chosen = latest_pinned or latest
+    if chosen is None:
+        return current_date, None, None
+    _, latest_version, latest_files = chosen
+    return current_date, latest_version, earliest_upload_date(latest_files or [])
+
+
+@lru_cache(maxsize=4096)
 def sanitize_sheet_name(name: str) -> str:
     cleaned = re.sub(r"[\\/*?:\\[\\]]", "_", name)
     return cleaned[:31] if cleaned else "Sheet"
 
 
-def fetch_pypi(name: str, session: requests.Session, cache: dict) -> dict | None:
-    if name in cache:
-        return cache[name]
+def styled_cell(
+    ws,
+    value,
+    fill: PatternFill | None = None,
+    font: Font | None = None,
+    alignment: Alignment | None = None,
+    number_format: str | None = None,
+) -> Cell:
+    cell = WriteOnlyCell(ws, value=value)
+    if fill is not None:
+        cell.fill = fill
+    if font is not None:
+        cell.font = font
+    if alignment is not None:
+        cell.alignment = alignment
+    if number_format is not None:
+        cell.number_format = number_format
+    return cell
+
+
+def track_column_lengths(max_lens: list[int], values: list) -> None:
+    for idx, value in enumerate(values):
+        if value is None:
+            continue
+        length = len(str(value))
+        if length > max_lens[idx]:
+            max_lens[idx] = length
+
+
+@lru_cache(maxsize=None)
+def column_letters(count: int) -> tuple[str, ...]:
+    return tuple(get_column_letter(idx) for idx in range(1, count + 1))
+
+
+def set_column_widths(ws, headers: list[str], max_lens: list[int]) -> None:
+    col_letters = column_letters(len(headers))
+    for idx, header in enumerate(headers):
+        width = max(max_lens[idx] + 2, int(len(header) * 1.25) + 4)
+        ws.column_dimensions[col_letters[idx]].width = width
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    def __init__(self, *args, max_rate: float = MAX_REQUESTS_PER_SECOND, **kwargs):
+        self.interval = 1.0 / max_rate if max_rate > 0 else 0.0
+        self.slot_lock = threading.Lock()
+        self.next_slot: dict[str, float] = {}
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):
+        if self.interval:
+            host = urlsplit(request.url).netloc
+            with self.slot_lock:
+                now = time.monotonic()
+                slot = max(now, self.next_slot.get(host, now))
+                self.next_slot[host] = slot + self.interval
+            if slot > now:
+                time.sleep(slot - now)
+        return super().send(request, *args, **kwargs)
+
+
+def build_session(
+    pool_maxsize: int = FETCH_WORKERS, max_rate: float = MAX_REQUESTS_PER_SECOND
+) -> requests.Session:
+    session = requests.Session()
+    session.headers.update({"User-Agent": "pip-release-report/1.0"})
+    # urllib3 adds br/zstd only when their decoders are installed.
+    session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)["accept-encoding"]
+    adapter = RateLimitedAdapter(
+        pool_connections=4,
+        pool_maxsize=pool_maxsize,
+        pool_block=True,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods=("GET",),
+            respect_retry_after_header=True,
+        ),
+        max_rate=max_rate,
+    )
+    session.mount("https://pypi.org", adapter)
+    session.mount("https://registry.npmjs.org", adapter)
+    return session
+
+
+def cache_file_for(cache_dir: Path | None, ecosystem: str, name: str) -> Path | None:
+    if cache_dir is None:
+        return None
+    return cache_dir / f"{ecosystem}_{quote(name, safe='')}.json"
+
+
+def read_cache_meta(path: Path | None) -> dict | None:
+    if path is None:
+        return None
     try:
-        resp = session.get(PYPI_URL.format(name=name), timeout=20)
-        if resp.status_code != 200:
-            cache[name] = None
-            return None
-        cache[name] = resp.json()
-        return cache[name]
-    except requests.RequestException:
-        cache[name] = None
+        meta = json.loads(path.with_suffix(".meta").read_bytes())
+    except (OSError, ValueError):
         return None
+    if not isinstance(meta, dict) or not isinstance(meta.get("fetched_at"), (int, float)):
+        return None
+    return meta
+
+
+def read_cache_body(path: Path | None) -> dict | None:
+    if path is None:
+        return None
+    try:
+        return load_json(path.read_bytes())
+    except (OSError, json.JSONDecodeError):
+        return None
+
+
+def write_cache_file(path: Path, content: bytes) -> None:
+    tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+    tmp_path.write_bytes(content)
+    tmp_path.replace(path)
+
+
+def write_cache_entry(path: Path | None, body: bytes | None, meta: dict) -> None:
+    if path is None:
+        return
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        if body is not None:
+            write_cache_file(path, body)
+        write_cache_file(path.with_suffix(".meta"), json.dumps(meta).encode("utf-8"))
+    except OSError:
+        pass
+
+
+def fetch_json(
+    url: str,
+    session: requests.Session,
+    cache_path: Path | None = None,
+    accept: str | None = None,
+) -> dict | None:
+    meta = read_cache_meta(cache_path)
+    now = time.time()
+    if meta and now - meta["fetched_at"] < CACHE_TTL_SECONDS:
+        data = read_cache_body(cache_path)
+        if data is not None:
+            return data
+        meta = None
+    base_headers = {"Accept": accept} if accept else {}
+    headers = dict(base_headers)
+    if meta:
+        etag, last_modified = meta.get("etag"), meta.get("last_modified")
+        if etag and isinstance(etag, str):
+            headers["If-None-Match"] = etag
+        if last_modified and isinstance(last_modified, str):
+            headers["If-Modified-Since"] = last_modified
+    resp = session.get(url, timeout=20, headers=headers)
+    if resp.status_code == 304 and meta:
+        data = read_cache_body(cache_path)
+        if data is not None:
+            write_cache_entry(cache_path, None, {**meta, "fetched_at": now})
+            return data
+        resp = session.get(url, timeout=20, headers=base_headers)
+    if resp.status_code != 200:
+        return None
+    data = load_json(resp.content)
+    write_cache_entry(
+        cache_path,
+        resp.content,
+        {
+            "fetched_at": now,
+            "etag": resp.headers.get("ETag"),
+            "last_modified": resp.headers.get("Last-Modified"),
+        },
+    )
+    return data
 
 
-def fetch_npm(name: str, session: requests.Session, cache: dict) -> dict | None:
+DIST_EXTENSIONS = (
+    ".tar.gz", ".tar.bz2", ".tar.xz", ".tgz", ".tar", ".zip", ".whl", ".egg", ".exe",
+    ".msi", ".rpm",
+)
+
+
+def normalize_project_name(name: str) -> str:
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+def file_version(filename: str, project: str, versions: dict[str, str]) -> str | None:
+    stem = filename
+    for ext in DIST_EXTENSIONS:
+        if stem.endswith(ext):
+            stem = stem[: -len(ext)]
+            break
+    parts = stem.split("-")
+    # The project name may itself contain dashes, so skip it by its normalized form.
+    start = next(
+        (
+            k
+            for k in range(1, len(parts))
+            if normalize_project_name("-".join(parts[:k])) == project
+        ),
+        1,
+    )
+    if start >= len(parts):
+        return None
+    if not versions:
+        return parts[start]
+    if filename.endswith(".whl"):
+        return versions.get(parts[start])
+    # Old bdists append ".<platform>" or "-py<X.Y>", so also try shorter prefixes.
+    rest = "-".join(parts[start:])
+    for cut in [len(rest), *(i for i in range(len(rest) - 1, 0, -1) if rest[i] in ".-")]:
+        if rest[:cut] in versions:
+            return versions[rest[:cut]]
+    return None
+
+
+def simple_to_releases(data: dict, name: str) -> dict:
+    project = normalize_project_name(data.get("name") or name)
+    versions: dict[str, str] = {}
+    for version in data.get("versions") or []:
+        versions[version] = version
+        # Wheel filenames carry the normalized spelling of the version
+        try:
+            versions.setdefault(str(parse_version(version)), version)
+        except ValueError:
+            pass
+    releases: dict[str, list] = {version: [] for version in data.get("versions") or []}
+    for file in data.get("files") or []:
+        version = file_version(file.get("filename", ""), project, versions)
+        if version is None:
+            continue
+        releases.setdefault(version, []).append(
+            {"upload_time_iso_8601": file.get("upload-time")}
+        )
+    return {"releases": releases}
+
+
+def fetch_pypi(
+    name: str,
+    session: requests.Session,
+    cache: dict,
+    cache_dir: Path | None = None,
+) -> dict | None:
+    if name in cache:
+        return cache[name]
+    try:
+        data = fetch_json(
+            pypi_url(name),
+            session,
+            cache_file_for(cache_dir, "pypi-simple", name),
+            accept=PYPI_SIMPLE_ACCEPT,
+        )
+    except (requests.RequestException, json.JSONDecodeError):
+        data = None
+    cache[name] = simple_to_releases(data, name) if isinstance(data, dict) else None
+    return cache[name]
+
+
+def fetch_npm(
+    name: str,
+    session: requests.Session,
+    cache: dict,
+    cache_dir: Path | None = None,
+) -> dict | None:
     if name in cache:
         return cache[name]
     try:
         encoded = requests.utils.quote(name, safe="@/")
-        resp = session.get(NPM_URL.format(name=encoded), timeout=20)
-        if resp.status_code != 200:
-            cache[name] = None
-            return None
-        cache[name] = resp.json()
+        cache[name] = fetch_json(
+            npm_url(encoded),
+            session,
+            cache_file_for(cache_dir, "npm", name),
+        )
         return cache[name]
-    except requests.RequestException:
+    except (requests.RequestException, json.JSONDecodeError):
         cache[name] = None
         return None
 
 
+def prefetch_packages(
+    grouped: dict[str, list[tuple[str, str, str]]],
+    session: requests.Session,
+    pypi_cache: dict,
+    npm_cache: dict,
+    executor: ThreadPoolExecutor,
+    cache_dir: Path | None = None,
+) -> dict[tuple[str, str], Future]:
+    caches = {"pypi": pypi_cache, "npm": npm_cache}
+    futures: dict[tuple[str, str], Future] = {}
+    for _, items in sorted(grouped.items()):
+        for name, _, ecosystem in items:
+            key = (ecosystem, name)
+            if key in futures:
+                continue
+            fetch = ECOSYSTEM_HANDLERS[ecosystem][0]
+            futures[key] = executor.submit(
+                fetch, name, session, caches[ecosystem], cache_dir
+            )
+    return futures
+
+
 def get_npm_release_date(time_map: dict, version: str) -> dt.date | None:
     if not version:
         return None
     ts = time_map.get(version)
     if not ts:
         return None
-    try:
-        return dt.datetime.fromisoformat(ts.replace("Z", "+00:00")).date()
-    except ValueError:
-        return None
+    return parse_iso_date(ts)
 
 
 def get_npm_latest_version(data: dict) -> str | None:
     dist_tags = data.get("dist-tags", {}) if isinstance(data, dict) else {}
     latest = dist_tags.get("latest")
-    if not vparse:
-        return latest if isinstance(latest, str) else None
     if isinstance(latest, str) and is_stable_version(latest):
         return latest
     time_map = data.get("time", {}) if isinstance(data, dict) else {}
-    versions = [
-        v
-        for v in time_map.keys()
-        if v not in ("created", "modified") and is_stable_version(v)
-    ]
-    if not versions:
-        return None
-    return str(max(versions, key=vparse))
+    newest = None
+    for version in time_map:
+        if version in ("created", "modified") or not is_stable_version(version):
+            continue
+        parsed = parse_version(version)
+        if newest is None or parsed > newest[0]:
+            newest = (parsed, version)
+    return newest[1] if newest else None
+
+
+def summarize_pypi(
+    lname: str, data: dict, current_version: str
+) -> tuple[dt.date | None, str | None, dt.date | None, str | None]:
+    releases = data.get("releases", {})
+    current_date, latest_version, latest_date = scan_releases(
+        releases, current_version, policy=MAJOR_PIN_POLICY.get(lname)
+    )
+    return current_date, latest_version, latest_date, current_version
+
+
+def summarize_npm(
+    lname: str, data: dict, current_version: str
+) -> tuple[dt.date | None, str | None, dt.date | None, str | None]:
+    time_map = data.get("time", {})
+    current_resolved = extract_npm_version(current_version)
+    current_date = get_npm_release_date(time_map, current_resolved)
+    latest_version = get_npm_latest_version(data)
+    latest_date = get_npm_release_date(time_map, latest_version)
+    return current_date, latest_version, latest_date, current_resolved
+
+
+ECOSYSTEM_HANDLERS = {
+    "pypi": (fetch_pypi, summarize_pypi),
+    "npm": (fetch_npm, summarize_npm),
+}
 
 
 def main() -> int:
@@ -294,6 +689,31 @@ def main() -> int:
         default="pip_release_report.xlsx",
         help="Output Excel file path (default: pip_release_report.xlsx).",
     )
+    parser.add_argument(
+        "--cache-dir",
+        default=str(CACHE_DIR),
+        help=f"Directory for cached PyPI/NPM responses (default: {CACHE_DIR}).",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=FETCH_WORKERS,
+        help=f"Concurrent PyPI/NPM requests (default: {FETCH_WORKERS}).",
+    )
+    parser.add_argument(
+        "--max-rate",
+        type=float,
+        default=MAX_REQUESTS_PER_SECOND,
+        help=(
+            "Requests per second allowed to each registry host; 0 disables "
+            f"the limit (default: {MAX_REQUESTS_PER_SECOND:g})."
+        ),
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always fetch fresh PyPI/NPM metadata and skip the on-disk cache.",
+    )
     args = parser.parse_args()
 
     root = Path(args.root).resolve()
@@ -320,13 +740,20 @@ def main() -> int:
 
     ba_map = load_ba_map(root / BA_LIST_PATH)
 
-    wb = Workbook()
-    wb.remove(wb.active)
+    if not OPENPYXL_LXML:
+        print(
+            "lxml is not installed; large reports will save slowly. "
+            "Install it with: pip install lxml",
+            file=sys.stderr,
+        )
+    wb = Workbook(write_only=True)
 
-    session = requests.Session()
-    session.headers.update({"User-Agent": "pip-release-report/1.0"})
+    workers = max(1, args.workers)
+    session = build_session(pool_maxsize=workers, max_rate=args.max_rate)
+    cache_dir = None if args.no_cache else Path(args.cache_dir).expanduser()
     pypi_cache: dict[str, dict | None] = {}
     npm_cache: dict[str, dict | None] = {}
+    summaries: dict[tuple[str, str, str], tuple] = {}
 
     headers = [
         "package",
@@ -343,13 +770,14 @@ def main() -> int:
         "business_approval_end_date",
         "business_approval_end_date_action",
     ]
+    summary_headers = ["section", *headers]
     summary_sections = ("sources", "tipcms", "collection", "etl")
     flagged_by_section: dict[str, list[list]] = {}
     zero_diff_by_section: dict[str, list[list]] = {}
     missing_ba_rows: list[list] = []
+    missing_max_lens = [len(header) for header in summary_headers]
     header_fill = PatternFill("solid", fgColor="1F4E78")
     header_font = Font(color="FFFFFF", bold=True, size=16)
-    link_font = Font(color="0563C1", underline="single")
     header_alignment = Alignment(horizontal="center", vertical="center")
     body_font = Font(size=14)
     body_alignment = Alignment(horizontal="center", vertical="center", wrap_text=True)
@@ -370,109 +798,100 @@ def main() -> int:
     in_review_ba_count: dict[str, int] = {s: 0 for s in summary_sections}
     strictly_missing_ba_count: dict[str, int] = {s: 0 for s in summary_sections}
 
-    for folder, items in sorted(grouped.items()):
+    def append_header_row(ws, sheet_headers: list[str]) -> None:
+        ws.append(
+            [
+                styled_cell(ws, header, header_fill, header_font, header_alignment)
+                for header in sheet_headers
+            ]
+        )
+
+    def write_summary_sheet(
+        title: str, rows_by_section: dict[str, list[list]], stale_row_fill: bool
+    ) -> None:
+        ws = wb.create_sheet(title=title)
+        non_ba_last_col = len(summary_headers) - 5
+        rows: list[list] = []
+        max_lens = [len(header) for header in summary_headers]
+        for section in summary_sections:
+            for row in rows_by_section.get(section, []):
+                rows.append([section, *row])
+                track_column_lengths(max_lens, rows[-1])
+        rows.sort(
+            key=lambda r: (r[8] is None, r[8] if r[8] is not None else -1),
+            reverse=True,
+        )
+
+        merges: list[tuple[int, int]] = []
+        continuation_rows: set[int] = set()
+        start_row = 2
+        for _, group in groupby(rows, key=itemgetter(*range(non_ba_last_col))):
+            block = list(group)
+            end_row = start_row + len(block) - 1
+            if end_row > start_row:
+                merges.append((start_row, end_row))
+                continuation_rows.update(range(start_row + 1, end_row + 1))
+            start_row = end_row + 1
+
+        set_column_widths(ws, summary_headers, max_lens)
+        append_header_row(ws, summary_headers)
+        for row_idx, values in enumerate(rows, start=2):
+            is_stale = isinstance(values[7], int) and values[7] > alert_threshold_days
+            row_fill = warning_fill if stale_row_fill and is_stale else alert_fill
+            ba_fill = ba_bad_fill
+            if (values[9] or "").strip():
+                status_val = (values[10] or "").strip().lower()
+                ba_fill = ba_ok_fill if status_val == "approved" else ba_bad_fill
+            cells = []
+            for col, value in enumerate(values, start=1):
+                if col <= non_ba_last_col and row_idx in continuation_rows:
+                    cells.append(None)
+                    continue
+                cell_fill = row_fill
+                if col == 8 and is_stale:
+                    cell_fill = warning_fill
+                if 10 <= col <= 14:
+                    cell_fill = ba_fill
+                if col == 13 and isinstance(value, dt.date):
+                    days_until_end = (value - today).days
+                    if 0 <= days_until_end <= 90:
+                        cell_fill = alert_fill
+                cell = styled_cell(
+                    ws,
+                    value,
+                    cell_fill,
+                    body_font,
+                    package_alignment if col == 2 else body_alignment,
+                    "DD-MMM-YYYY" if col in (4, 6, 11, 12) and value else None,
+                )
+                if col == 10 and value:
+                    cell.hyperlink = ba_link(value)
+                cells.append(cell)
+            ws.append(cells)
+        for start_row, end_row in merges:
+            for col in range(1, non_ba_last_col + 1):
+                ws.merged_cells.add(
+                    CellRange(min_col=col, min_row=start_row, max_col=col, max_row=end_row)
+                )
+
+    def write_folder_sheet(folder: str, items: list[tuple[str, str, str]]) -> None:
         ws = wb.create_sheet(title=sanitize_sheet_name(folder))
-        ws.append(headers)
-        for col in range(1, len(headers) + 1):
-            cell = ws.cell(row=1, column=col)
-            cell.fill = header_fill
-            cell.font = header_font
-            cell.alignment = header_alignment
         rows_info: list[
             tuple[list, bool, list[tuple[str, dict[str, dt.date | str | None]]]]
         ] = []
         for name, current_version, ecosystem in items:
-            if name.lower() in EXCLUDED_PACKAGES:
+            lname = name.casefold()
+            summarize = ECOSYSTEM_HANDLERS[ecosystem][1]
+            data = fetches[(ecosystem, name)].result()
+            if not data:
+                rows_info.append(([name, current_version, *EMPTY_ROW_TRAIL], False, []))
                 continue
-            if ecosystem == "pypi":
-                data = fetch_pypi(name, session, pypi_cache)
-                if not data:
-                    rows_info.append(
-                        (
-                            [
-                                name,
-                                current_version,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                            ],
-                            False,
-                        )
-                    )
-                    continue
-
-                info = data.get("info", {})
-                releases = data.get("releases", {})
-                current_date = get_release_date(releases, current_version)
-                if name.lower() == "django":
-                    latest_version = get_latest_version_same_major(releases, current_version)
-                    if not latest_version:
-                        latest_version = get_latest_version(info, releases)
-                else:
-                    latest_version = get_latest_version(info, releases)
-                latest_date = get_release_date(releases, latest_version) if latest_version else None
-                ba_version = current_version
-            else:
-                data = fetch_npm(name, session, npm_cache)
-                if not data:
-                    rows_info.append(
-                        (
-                            [
-                                name,
-                                current_version,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                                None,
-                            ],
-                            False,
-                        )
-                    )
-                    continue
+            summary_key = (ecosystem, name, current_version)
+            if summary_key not in summaries:
+                summaries[summary_key] = summarize(lname, data, current_version)
+            current_date, latest_version, latest_date, ba_version = summaries[summary_key]
 
-                time_map = data.get("time", {})
-                current_resolved = extract_npm_version(current_version)
-                current_date = get_npm_release_date(time_map, current_resolved)
-                latest_version = get_npm_latest_version(data)
-                latest_date = get_npm_release_date(time_map, latest_version)
-                ba_version = current_resolved
-
-            ba_entries: list[tuple[str, dict[str, dt.date | str | None]]] = []
-            if ba_version:
-                ba_ids_map = ba_map.get((name.lower(), ba_version))
-                if ba_ids_map:
-                    def ba_sort_key(item: tuple[str, dict[str, dt.date | str | None]]):
-                        ba_id, meta = item
-                        end_date = meta.get("end_date")
-                        if isinstance(end_date, dt.date):
-                            key_date = end_date
-                        elif isinstance(end_date, str):
-                            try:
-                                key_date = dt.date.fromisoformat(end_date)
-                            except ValueError:
-                                key_date = None
-                        else:
-                            key_date = None
-                        status = (meta.get("status") or "").lower()
-                        status_priority = 1 if status == "approved" else 0
-                        return (key_date is None, key_date or dt.date.max, status_priority, ba_id)
-
-                    ba_entries = sorted(ba_ids_map.items(), key=ba_sort_key, reverse=True)
+            ba_entries = ba_map.get((lname, ba_version), []) if ba_version else []
 
             days_diff = None
             if current_date and latest_date:
@@ -510,20 +929,21 @@ def main() -> int:
             key=lambda r: (r[0][7] is None, r[0][7] if r[0][7] is not None else -1),
             reverse=True,
         )
-        ba_blocks: list[tuple[int, int, PatternFill]] = []
+        # (values, is_alert, ba_fill, merged_into_previous) per written row
+        sheet_rows: list[tuple[list, bool, PatternFill | None, bool]] = []
+        col_max_lens = [len(header) for header in headers]
+        merged_blocks: list[tuple[int, int]] = []
         for row, is_alert, ba_entries in rows_info:
             if folder in summary_sections:
                 total_packages_count[folder] += 1
-            start_row = ws.max_row + 1
+            start_row = len(sheet_rows) + 2
             expanded_rows: list[list] = []
             ba_fill = None
             if ba_entries:
                 top_status = (ba_entries[0][1].get("status") or "").strip().lower()
                 ba_fill = ba_ok_fill if top_status == "approved" else ba_bad_fill
             if not ba_entries:
-                ws.append(row)
                 expanded_rows.append(row)
-                end_row = start_row
             else:
                 for ba_id, ba_meta in ba_entries:
                     row_with_ba = row.copy()
@@ -532,24 +952,16 @@ def main() -> int:
                     row_with_ba[10] = ba_meta.get("created")
                     row_with_ba[11] = ba_meta.get("end_date")
                     row_with_ba[12] = ba_meta.get("end_action")
-                    ws.append(row_with_ba)
-                    ba_cell = ws.cell(row=ws.max_row, column=9)
-                    ba_cell.hyperlink = BA_LINK_TEMPLATE.format(ba_id=ba_id)
-                    ba_cell.font = link_font
                     expanded_rows.append(row_with_ba)
                 end_row = start_row + len(ba_entries) - 1
                 if end_row > start_row:
-                    for col in range(1, len(headers) + 1):
-                        if col in (9, 10, 11, 12, 13):
-                            continue
-                        ws.merge_cells(
-                            start_row=start_row,
-                            start_column=col,
-                            end_row=end_row,
-                            end_column=col,
-                        )
-            if ba_fill:
-                ba_blocks.append((start_row, start_row, ba_fill))
+                    merged_blocks.append((start_row, end_row))
+            sheet_rows.append((expanded_rows[0], is_alert, ba_fill, False))
+            track_column_lengths(col_max_lens, expanded_rows[0])
+            for row_with_ba in expanded_rows[1:]:
+                values = [None] * 8 + row_with_ba[8:]
+                sheet_rows.append((values, False, None, True))
+                track_column_lengths(col_max_lens, values)
             if is_alert and folder in summary_sections:
                 flagged_by_section.setdefault(folder, []).extend(expanded_rows)
                 upgradation_count[folder] += 1
@@ -565,293 +977,87 @@ def main() -> int:
                 package_missing_ba = True
                 if expanded_rows:
                     missing_ba_rows.append([folder, *expanded_rows[0]])
+                    track_column_lengths(missing_max_lens, missing_ba_rows[-1])
             if package_missing_ba and folder in summary_sections:
                 missing_ba_count[folder] += 1
                 if not ba_entries:
                     strictly_missing_ba_count[folder] += 1
                 else:
                     in_review_ba_count[folder] += 1
-        for row in range(2, ws.max_row + 1):
-            days_value = ws.cell(row=row, column=8).value
-            diff_value = ws.cell(row=row, column=6).value
-            if (
-                isinstance(days_value, int)
-                and days_value > alert_threshold_days
-                and isinstance(diff_value, int)
-                and diff_value > 0
-            ):
+        set_column_widths(ws, headers, col_max_lens)
+        append_header_row(ws, headers)
+        for row_idx, (values, is_alert, ba_fill, merged_row) in enumerate(sheet_rows, start=2):
+            if is_alert:
                 fill = alert_fill
             else:
-                fill = even_fill if row % 2 == 0 else odd_fill
-            for col in range(1, len(headers) + 1):
-                cell = ws.cell(row=row, column=col)
-                cell.fill = fill
-                cell.font = body_font
-                cell.alignment = package_alignment if col == 1 else body_alignment
-                if col in (3, 5, 11, 12) and cell.value:
-                    cell.number_format = "DD-MMM-YYYY"
-                if col == 7 and isinstance(cell.value, int) and cell.value > alert_threshold_days:
-                    cell.fill = warning_fill
+                fill = even_fill if row_idx % 2 == 0 else odd_fill
+            cells = []
+            for col, value in enumerate(values, start=1):
+                if col <= 8 and merged_row:
+                    cells.append(None)
+                    continue
+                cell_fill = fill
+                if col == 7 and isinstance(value, int) and value > alert_threshold_days:
+                    cell_fill = warning_fill
                 if col in (9, 10, 11, 12, 13):
-                    if not ws.cell(row=row, column=9).value:
-                        cell.fill = ba_bad_fill
-                    else:
-                        for start_row, end_row, ba_fill in ba_blocks:
-                            if start_row <= row <= end_row:
-                                cell.fill = ba_fill
-                                break
-                if col == 12 and isinstance(cell.value, dt.date):
-                    days_until_end = (cell.value - today).days
+                    if not values[8]:
+                        cell_fill = ba_bad_fill
+                    elif ba_fill:
+                        cell_fill = ba_fill
+                if col == 12 and isinstance(value, dt.date):
+                    days_until_end = (value - today).days
                     if 0 <= days_until_end <= 90:
-                        cell.fill = alert_fill
-        for col in range(1, len(headers) + 1):
-            max_len = 0
-            for row in range(1, ws.max_row + 1):
-                value = ws.cell(row=row, column=col).value
-                if value is None:
-                    continue
-                max_len = max(max_len, len(str(value)))
-            header_len = len(str(headers[col - 1]))
-            width = max(max_len + 2, int(header_len * 1.25) + 4)
-            ws.column_dimensions[chr(64 + col)].width = width
-
-    summary_headers = ["section", *headers]
-    summary_ws = wb.create_sheet(title="Upgradation")
-    summary_ws.append(summary_headers)
-    for col in range(1, len(summary_headers) + 1):
-        cell = summary_ws.cell(row=1, column=col)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
-
-    summary_rows: list[list] = []
-    for section in summary_sections:
-        for row in flagged_by_section.get(section, []):
-            summary_rows.append([section, *row])
-    summary_rows.sort(
-        key=lambda r: (r[8] is None, r[8] if r[8] is not None else -1),
-        reverse=True,
-    )
-    for row in summary_rows:
-        summary_ws.append(row)
-        ba_id = summary_ws.cell(row=summary_ws.max_row, column=10).value
-        if ba_id:
-            ba_cell = summary_ws.cell(row=summary_ws.max_row, column=10)
-            ba_cell.hyperlink = BA_LINK_TEMPLATE.format(ba_id=ba_id)
-            ba_cell.font = link_font
-
-    for row in range(2, summary_ws.max_row + 1):
-        for col in range(1, len(summary_headers) + 1):
-            cell = summary_ws.cell(row=row, column=col)
-            cell.fill = alert_fill
-            cell.font = body_font
-            cell.alignment = package_alignment if col == 2 else body_alignment
-            if col in (4, 6, 11, 12) and cell.value:
-                cell.number_format = "DD-MMM-YYYY"
-            if col == 8 and isinstance(cell.value, int) and cell.value > alert_threshold_days:
-                cell.fill = warning_fill
-
-    for col in range(1, len(summary_headers) + 1):
-        max_len = 0
-        for row in range(1, summary_ws.max_row + 1):
-            value = summary_ws.cell(row=row, column=col).value
-            if value is None:
-                continue
-            max_len = max(max_len, len(str(value)))
-        header_len = len(str(summary_headers[col - 1]))
-        width = max(max_len + 2, int(header_len * 1.25) + 4)
-        summary_ws.column_dimensions[chr(64 + col)].width = width
-    if summary_ws.max_row > 2:
-        non_ba_last_col = len(summary_headers) - 5
-        start_row = 2
-        while start_row <= summary_ws.max_row:
-            end_row = start_row
-            while end_row + 1 <= summary_ws.max_row:
-                if all(
-                    summary_ws.cell(row=end_row + 1, column=col).value
-                    == summary_ws.cell(row=start_row, column=col).value
-                    for col in range(1, non_ba_last_col + 1)
-                ):
-                    end_row += 1
-                else:
-                    break
-            if end_row > start_row:
-                for col in range(1, non_ba_last_col + 1):
-                    summary_ws.merge_cells(
-                        start_row=start_row,
-                        start_column=col,
-                        end_row=end_row,
-                        end_column=col,
-                    )
-            start_row = end_row + 1
-    if summary_ws.max_row > 2:
-        non_ba_last_col = len(summary_headers) - 5
-        start_row = 2
-        while start_row <= summary_ws.max_row:
-            end_row = start_row
-            while end_row + 1 <= summary_ws.max_row:
-                if all(
-                    summary_ws.cell(row=end_row + 1, column=col).value
-                    == summary_ws.cell(row=start_row, column=col).value
-                    for col in range(1, non_ba_last_col + 1)
-                ):
-                    end_row += 1
-                else:
-                    break
-            ba_id_val = (summary_ws.cell(row=start_row, column=10).value or "").strip()
-            if ba_id_val:
-                status_val = (
-                    summary_ws.cell(row=start_row, column=11).value or ""
-                ).strip().lower()
-                ba_fill = ba_ok_fill if status_val == "approved" else ba_bad_fill
-            else:
-                ba_fill = ba_bad_fill
-            for col in range(10, 15):
-                summary_ws.cell(row=start_row, column=col).fill = ba_fill
-            start_row = end_row + 1
-        for row in range(2, summary_ws.max_row + 1):
-            end_date_val = summary_ws.cell(row=row, column=13).value
-            if isinstance(end_date_val, dt.date):
-                days_until_end = (end_date_val - today).days
-                if 0 <= days_until_end <= 90:
-                    summary_ws.cell(row=row, column=13).fill = alert_fill
-
-    zero_ws = wb.create_sheet(title="Replace-Remove Libs")
-    zero_ws.append(summary_headers)
-    for col in range(1, len(summary_headers) + 1):
-        cell = zero_ws.cell(row=1, column=col)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
-
-    zero_rows: list[list] = []
-    for section in summary_sections:
-        for row in zero_diff_by_section.get(section, []):
-            zero_rows.append([section, *row])
-    zero_rows.sort(
-        key=lambda r: (r[8] is None, r[8] if r[8] is not None else -1),
-        reverse=True,
-    )
-    for row in zero_rows:
-        zero_ws.append(row)
-        ba_id = zero_ws.cell(row=zero_ws.max_row, column=10).value
-        if ba_id:
-            ba_cell = zero_ws.cell(row=zero_ws.max_row, column=10)
-            ba_cell.hyperlink = BA_LINK_TEMPLATE.format(ba_id=ba_id)
-            ba_cell.font = link_font
-
-    for row in range(2, zero_ws.max_row + 1):
-        days_latest = zero_ws.cell(row=row, column=8).value
-        row_fill = (
-            warning_fill
-            if isinstance(days_latest, int) and days_latest > alert_threshold_days
-            else alert_fill
+                        cell_fill = alert_fill
+                cell = styled_cell(
+                    ws,
+                    value,
+                    cell_fill,
+                    body_font,
+                    package_alignment if col == 1 else body_alignment,
+                    "DD-MMM-YYYY" if col in (3, 5, 11, 12) and value else None,
+                )
+                if col == 9 and value:
+                    cell.hyperlink = ba_link(value)
+                cells.append(cell)
+            ws.append(cells)
+        for start_row, end_row in merged_blocks:
+            for col in range(1, 9):
+                ws.merged_cells.add(
+                    CellRange(min_col=col, min_row=start_row, max_col=col, max_row=end_row)
+                )
+
+    executor = ThreadPoolExecutor(max_workers=workers)
+    try:
+        fetches = prefetch_packages(
+            grouped, session, pypi_cache, npm_cache, executor, cache_dir
         )
-        for col in range(1, len(summary_headers) + 1):
-            cell = zero_ws.cell(row=row, column=col)
-            cell.fill = row_fill
-            cell.font = body_font
-            cell.alignment = package_alignment if col == 2 else body_alignment
-            if col in (4, 6, 11, 12) and cell.value:
-                cell.number_format = "DD-MMM-YYYY"
-
-    for col in range(1, len(summary_headers) + 1):
-        max_len = 0
-        for row in range(1, zero_ws.max_row + 1):
-            value = zero_ws.cell(row=row, column=col).value
-            if value is None:
-                continue
-            max_len = max(max_len, len(str(value)))
-        header_len = len(str(summary_headers[col - 1]))
-        width = max(max_len + 2, int(header_len * 1.25) + 4)
-        zero_ws.column_dimensions[chr(64 + col)].width = width
-    if zero_ws.max_row > 2:
-        non_ba_last_col = len(summary_headers) - 5
-        start_row = 2
-        while start_row <= zero_ws.max_row:
-            end_row = start_row
-            while end_row + 1 <= zero_ws.max_row:
-                if all(
-                    zero_ws.cell(row=end_row + 1, column=col).value
-                    == zero_ws.cell(row=start_row, column=col).value
-                    for col in range(1, non_ba_last_col + 1)
-                ):
-                    end_row += 1
-                else:
-                    break
-            if end_row > start_row:
-                for col in range(1, non_ba_last_col + 1):
-                    zero_ws.merge_cells(
-                        start_row=start_row,
-                        start_column=col,
-                        end_row=end_row,
-                        end_column=col,
-                    )
-            start_row = end_row + 1
-    if zero_ws.max_row > 2:
-        non_ba_last_col = len(summary_headers) - 5
-        start_row = 2
-        while start_row <= zero_ws.max_row:
-            end_row = start_row
-            while end_row + 1 <= zero_ws.max_row:
-                if all(
-                    zero_ws.cell(row=end_row + 1, column=col).value
-                    == zero_ws.cell(row=start_row, column=col).value
-                    for col in range(1, non_ba_last_col + 1)
-                ):
-                    end_row += 1
-                else:
-                    break
-            ba_id_val = (zero_ws.cell(row=start_row, column=10).value or "").strip()
-            if ba_id_val:
-                status_val = (zero_ws.cell(row=start_row, column=11).value or "").strip().lower()
-                ba_fill = ba_ok_fill if status_val == "approved" else ba_bad_fill
-            else:
-                ba_fill = ba_bad_fill
-            for col in range(10, 15):
-                zero_ws.cell(row=start_row, column=col).fill = ba_fill
-            start_row = end_row + 1
-        for row in range(2, zero_ws.max_row + 1):
-            end_date_val = zero_ws.cell(row=row, column=13).value
-            if isinstance(end_date_val, dt.date):
-                days_until_end = (end_date_val - today).days
-                if 0 <= days_until_end <= 90:
-                    zero_ws.cell(row=row, column=13).fill = alert_fill
+        for folder, items in sorted(grouped.items()):
+            write_folder_sheet(folder, items)
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+    write_summary_sheet("Upgradation", flagged_by_section, stale_row_fill=False)
+    write_summary_sheet("Replace-Remove Libs", zero_diff_by_section, stale_row_fill=True)
 
     missing_ws = wb.create_sheet(title="Missing-NonApproved-BAs")
-    missing_ws.append(summary_headers)
-    for col in range(1, len(summary_headers) + 1):
-        cell = missing_ws.cell(row=1, column=col)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
-    for row in missing_ba_rows:
-        missing_ws.append(row)
-    for row in range(2, missing_ws.max_row + 1):
-        for col in range(1, len(summary_headers) + 1):
-            cell = missing_ws.cell(row=row, column=col)
-            cell.fill = ba_bad_fill if col >= 10 else even_fill if row % 2 == 0 else odd_fill
-            cell.font = body_font
-            cell.alignment = package_alignment if col == 2 else body_alignment
-            if col in (4, 6, 11, 12) and cell.value:
-                cell.number_format = "DD-MMM-YYYY"
-    for col in range(1, len(summary_headers) + 1):
-        max_len = 0
-        for row in range(1, missing_ws.max_row + 1):
-            value = missing_ws.cell(row=row, column=col).value
-            if value is None:
-                continue
-            max_len = max(max_len, len(str(value)))
-        header_len = len(str(summary_headers[col - 1]))
-        width = max(max_len + 2, int(header_len * 1.25) + 4)
-        missing_ws.column_dimensions[chr(64 + col)].width = width
+    set_column_widths(missing_ws, summary_headers, missing_max_lens)
+    append_header_row(missing_ws, summary_headers)
+    for row_idx, values in enumerate(missing_ba_rows, start=2):
+        missing_ws.append(
+            [
+                styled_cell(
+                    missing_ws,
+                    value,
+                    ba_bad_fill if col >= 10 else even_fill if row_idx % 2 == 0 else odd_fill,
+                    body_font,
+                    package_alignment if col == 2 else body_alignment,
+                    "DD-MMM-YYYY" if col in (4, 6, 11, 12) and value else None,
+                )
+                for col, value in enumerate(values, start=1)
+            ]
+        )
 
     overview_ws = wb.create_sheet(title="Overview")
-    overview_ws.append(["Percentage Completions"])
-    heading_cell = overview_ws.cell(row=1, column=1)
-    heading_cell.font = Font(size=18, bold=True)
-
-    overview_ws.append([])
 
     overview_headers = [
         "Repos",
@@ -861,12 +1067,17 @@ def main() -> int:
         "In-Review BAs",
         "Missing BAs",
     ]
-    overview_ws.append(overview_headers)
-    for col in range(1, len(overview_headers) + 1):
-        cell = overview_ws.cell(row=3, column=col)
-        cell.fill = header_fill
-        cell.font = header_font
-        cell.alignment = header_alignment
+
+    overview_rows: list[list] = []
+    overview_max_lens = [len(header) for header in overview_headers]
+
+    def add_overview_row(values: list) -> None:
+        overview_rows.append(values)
+        # Percentages are measured as rendered by the 0.00% number format.
+        track_column_lengths(
+            overview_max_lens,
+            [f"{val * 100:.2f}%" if isinstance(val, float) else val for val in values],
+        )
 
     tot_pkgs = 0
     tot_upg = 0
@@ -892,43 +1103,40 @@ def main() -> int:
         pct_m = (t - m) / t if t > 0 else 1.0
         pct_in_rev = in_rev / t if t > 0 else 0.0
         pct_str_mis = str_mis / t if t > 0 else 0.0
-        overview_ws.append([section, pct_u, pct_r, pct_m, pct_in_rev, pct_str_mis])
+        add_overview_row([section, pct_u, pct_r, pct_m, pct_in_rev, pct_str_mis])
 
     pct_tot_u = (tot_pkgs - tot_upg) / tot_pkgs if tot_pkgs > 0 else 1.0
     pct_tot_r = (tot_pkgs - tot_rep) / tot_pkgs if tot_pkgs > 0 else 1.0
     pct_tot_m = (tot_pkgs - tot_mis) / tot_pkgs if tot_pkgs > 0 else 1.0
     pct_tot_in_rev = tot_in_rev / tot_pkgs if tot_pkgs > 0 else 0.0
     pct_tot_str_mis = tot_str_mis / tot_pkgs if tot_pkgs > 0 else 0.0
-    overview_ws.append(["Total", pct_tot_u, pct_tot_r, pct_tot_m, pct_tot_in_rev, pct_tot_str_mis])
-
-    for row_idx in range(4, overview_ws.max_row + 1):
-        is_total = (row_idx == overview_ws.max_row)
-        for col_idx in range(1, len(overview_headers) + 1):
-            cell = overview_ws.cell(row=row_idx, column=col_idx)
-            cell.font = Font(size=14, bold=is_total)
-            if col_idx == 1:
-                cell.alignment = package_alignment
-            else:
-                cell.alignment = body_alignment
-                cell.number_format = "0.00%"
-            cell.fill = even_fill if row_idx % 2 == 0 else odd_fill
-
-    for col in range(1, len(overview_headers) + 1):
-        max_len = 0
-        for row in range(3, overview_ws.max_row + 1):
-            val = overview_ws.cell(row=row, column=col).value
-            if val is None:
-                continue
-            str_val = f"{val * 100:.2f}%" if isinstance(val, float) else str(val)
-            max_len = max(max_len, len(str_val))
-        header_len = len(str(overview_headers[col - 1]))
-        width = max(max_len + 2, int(header_len * 1.25) + 4)
-        overview_ws.column_dimensions[chr(64 + col)].width = width
+    add_overview_row(["Total", pct_tot_u, pct_tot_r, pct_tot_m, pct_tot_in_rev, pct_tot_str_mis])
+
+    set_column_widths(overview_ws, overview_headers, overview_max_lens)
+
+    overview_ws.append([styled_cell(overview_ws, "Percentage Completions", font=Font(size=18, bold=True))])
+    overview_ws.append([])
+    append_header_row(overview_ws, overview_headers)
+    for row_idx, values in enumerate(overview_rows, start=4):
+        is_total = row_idx == len(overview_rows) + 3
+        row_font = Font(size=14, bold=is_total)
+        row_fill = even_fill if row_idx % 2 == 0 else odd_fill
+        overview_ws.append(
+            [
+                styled_cell(
+                    overview_ws,
+                    value,
+                    row_fill,
+                    row_font,
+                    package_alignment if col == 1 else body_alignment,
+                    None if col == 1 else "0.00%",
+                )
+                for col, value in enumerate(values, start=1)
+            ]
+        )
 
     overview_ws.append([])
-    overview_ws.append(["Note:"])
-    note_cell = overview_ws.cell(row=overview_ws.max_row, column=1)
-    note_cell.font = Font(bold=True)
+    overview_ws.append([styled_cell(overview_ws, "Note:", font=Font(bold=True))])
     overview_ws.append(["1. Sufficiently Latest - Libs which are not older than 2 years."])
     overview_ws.append(["2. Missing BAs might also mean that BA is raised but it is not captured while creating this excel data."])
 